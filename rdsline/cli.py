@@ -1,31 +1,27 @@
 """
 The main entry point for rdsline.
 """
-import logging
-import argparse
 import readline  # pylint: disable=unused-import
-import os
 import sys
+from types import SimpleNamespace
 from typing import List
-from rdsline import settings
 from rdsline.version import VERSION
-from rdsline.connections import Connection
+from rdsline.commands import ConfigCommand, DebugCommand
 
 
-def _help():
-    return "\n".join(
-        [
-            ".quit - quits the REPL",
-            ".config <config_file> - sets new connection settings from a file",
-            ".show - displays current connection settings",
-            ".debug - toggle debugging information",
-        ]
-    )
+_HELP_TEXT = "\n".join(
+    [
+        ".quit - quits the REPL",
+        ".config <config_file> - sets new connection settings from a file",
+        ".show - displays current connection settings",
+        ".debug - toggle debugging information",
+    ]
+)
 
 
 def _read(prompt: str) -> str:
     try:
-        line = input(f"{prompt}")
+        line = input(prompt)
         if line == ".quit":
             sys.exit(0)
         return line
@@ -33,84 +29,127 @@ def _read(prompt: str) -> str:
         sys.exit(0)
 
 
-def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="The RDS REPL v" + VERSION)
-    parser.add_argument(
-        "--config", type=str, required=False, help="Config file to read settings from"
-    )
-    parser.add_argument(
-        "--debug", required=False, action="store_true", help="Turn debugging information on."
-    )
-    return parser.parse_args()
-
-
-class DebugCommand:
-    """
-    Toggles debug logging on/off.
-    """
-
-    def __init__(self, is_debug: bool):
-        self.is_debug = is_debug
-        logging.basicConfig(level=logging.DEBUG if is_debug else logging.WARN)
-
-    def __call__(self, _):
-        self.is_debug = not self.is_debug
-        logging.getLogger().setLevel(logging.DEBUG if self.is_debug else logging.WARN)
-        return "Debugging is " + ("ON" if self.is_debug else "OFF")
-
-
-class ConfigCommand:
-    """
-    Config command.
-    """
-
-    def __init__(self, connection: Connection):
-        self.connection = connection
-
-    def __call__(self, args: List[str]) -> str:
-        if len(args) != 2:
-            return "ERROR: Expecting config file"
-        (_, config_file) = args
-        self.connection = settings.from_file(os.path.expanduser(config_file))
-        return str(self.connection)
+def _read_piped(_: str) -> str:
+    # Non-interactive stdin: no prompt to print, so read the buffered stream directly.
+    line = sys.stdin.readline()
+    if not line:
+        sys.exit(0)
+    line = line[:-1] if line.endswith("\n") else line
+    if line == ".quit":
+        sys.exit(0)
+    return line
+
+
+_USAGE = "usage: rdsline [-h] [--config CONFIG] [--debug] [--version]"
+
+_ARGS_HELP = "\n".join(
+    [
+        _USAGE,
+        "",
+        "The RDS REPL v" + VERSION,
+        "",
+        "options:",
+        "  -h, --help       show this help message and exit",
+        "  --config CONFIG  Config file to read settings from",
+        "  --debug          Turn debugging information on.",
+        "  --version        show program's version number and exit",
+    ]
+)
+
+
+_LONG_OPTIONS = ("--help", "--version", "--debug", "--config")
+
+
+def _usage_error(message: str):
+    print(_USAGE, file=sys.stderr)
+    print(f"rdsline: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _long_option(arg: str):
+    # Like argparse, accept any unique prefix of a long option ("--conf", "--deb").
+    (option, has_value, value) = arg.partition("=")
+    if len(option) > 2 and option.startswith("--"):
+        matches = [name for name in _LONG_OPTIONS if name.startswith(option)]
+        if len(matches) == 1:
+            return (matches[0], has_value, value)
+    return (arg, "", "")
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    # Hand-rolled instead of argparse: three flags do not justify importing it on every start.
+    args = SimpleNamespace(config=None, debug=False)
+    remaining = iter(argv)
+    for arg in remaining:
+        (option, has_value, value) = _long_option(arg)
+        if has_value and option != "--config":
+            _usage_error(f"argument {option}: ignored explicit argument '{value}'")
+        if option in ("-h", "--help"):
+            print(_ARGS_HELP)
+            sys.exit(0)
+        elif option == "--version":
+            print("rdsline " + VERSION)
+            sys.exit(0)
+        elif option == "--debug":
+            args.debug = True
+        elif option == "--config":
+            if not has_value:
+                value = next(remaining, None)
+                if value is None or value.startswith("-"):
+                    _usage_error("argument --config: expected one argument")
+            args.config = value
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+    return args
 
 
 def main():
     """
     The main entry point for the program.
     """
-    args = _parse_args()
+    args = _parse_args(sys.argv[1:])
+    # settings pulls in the connections (and tabulate), so only import it once args are parsed.
+    from rdsline import settings  # pylint: disable=import-outside-toplevel
+
+    # Set up logging before loading the config so its debug output isn't lost.
+    debug = DebugCommand(args.debug)
     config = ConfigCommand(settings.from_args(args))
     commands = {
-        ".help": lambda _: _help(),
+        ".help": lambda _: _HELP_TEXT,
         ".show": lambda _: str(config.connection),
-        ".debug": DebugCommand(args.debug),
+        ".debug": debug,
         ".config": config,
     }
-    buffer = ""
+    buffer: List[str] = []
     default_prompt = ""
+    read = _read_piped
     if sys.stdin.isatty():
+        read = _read
         default_prompt = "> "
         print("The RDS REPL v" + VERSION)
         print("Type .help for help")
     prompt = default_prompt
     while True:
-        line = _read(prompt)
-        if line and line[0] == ".":
-            args = line.split(" ")
-            if args[0] in commands:
-                print(commands[args[0]](args))
+        line = read(prompt)
+        if line.startswith("."):
+            (name, _, arg) = line.partition(" ")
+            command = commands.get(name)
+            if command is not None:
+                print(command([name, arg]))
         elif line.endswith(";") or line == "":
-            buffer += line
+            buffer.append(line)
+            sql = " ".join(buffer)
+            buffer.clear()
+            prompt = default_prompt
+            if not sql.strip():
+                # Nothing typed: don't send an empty statement to the database.
+                continue
             try:
-                print(config.connection.execute(buffer))
+                print(config.connection.execute(sql))
             except Exception as ex:  # pylint: disable=broad-except
                 print(f"Error: {str(ex)}")
-            finally:
-                buffer = ""
-                prompt = default_prompt
         else:
-            buffer += line + " "
+            buffer.append(line)
             prompt = "|"
 
 
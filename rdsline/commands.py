@@ -0,0 +1,46 @@
+"""
+REPL commands (the dot-commands).
+"""
+import logging
+import os
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rdsline.connections import Connection
+
+
+class DebugCommand:
+    """
+    Toggles debug logging on/off.
+    """
+
+    # Indexed by is_debug.
+    _LEVELS = (logging.WARN, logging.DEBUG)
+    _MESSAGES = ("Debugging is OFF", "Debugging is ON")
+
+    def __init__(self, is_debug: bool):
+        self.is_debug = is_debug
+        logging.basicConfig(level=self._LEVELS[is_debug])
+
+    def __call__(self, _):
+        self.is_debug = not self.is_debug
+        logging.getLogger().setLevel(self._LEVELS[self.is_debug])
+        return self._MESSAGES[self.is_debug]
+
+
+class ConfigCommand:
+    """
+    Config command.
+    """
+
+    def __init__(self, connection: "Connection"):
+        self.connection = connection
+
+    def __call__(self, args: List[str]) -> str:
+        config_file = args[1].strip() if len(args) == 2 else ""
+        if not config_file:
+            return "ERROR: Expecting config file"
+        from rdsline import settings  # pylint: disable=import-outside-toplevel
+
+        self.connection = settings.from_file(os.path.expanduser(config_file))
+        return str(self.connection)
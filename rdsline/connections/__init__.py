@@ -25,5 +25,8 @@ class NoopConnection(Connection):
     def __init__(self):
         pass
 
+    def __str__(self):
+        return "No connection set"
+
     def execute(self, _: str) -> StatementResult:
         return NullResult()
@@ -2,25 +2,30 @@
 Connection for RDS with a Secrets Manager secret.
 """
 import logging
-from typing import Any
+from typing import Any, Callable, Dict
 from rdsline.connections import Connection
 from rdsline.results import DMLResult, QueryResult, StatementResult
 
 
+# Converters for each Data API Field member, called with that member's value.
+_CONVERTERS: Dict[str, Callable[[Any], str]] = {
+    "stringValue": str,
+    "booleanValue": str,
+    "doubleValue": str,
+    "longValue": str,
+    "blobValue": lambda v: "BLOB(" + v.hex() + ")",
+    "arrayValue": lambda _: "ARRAY",
+}
+
+
 def _to_string(val: Any) -> str:
-    known_types = {
-        "stringValue": lambda v: v["stringValue"],
-        "booleanValue": lambda v: str(v["booleanValue"]),
-        "doubleValue": lambda v: str(v["doubleValue"]),
-        "longValue": lambda v: str(v["longValue"]),
-        "blobValue": lambda v: "BLOB(" + v["blobValue"].hex() + ")",
-        "arrayValue": lambda v: "ARRAY",
-    }
-    if "isNull" in val and val["isNull"]:
+    if val.get("isNull"):
         return "NULL"
-    for (type_name, converter) in known_types.items():
-        if type_name in val:
-            return converter(val)
+    # A Field sets a single member, so walking its own keys beats probing every known type.
+    for (type_name, value) in val.items():
+        converter = _CONVERTERS.get(type_name)
+        if converter is not None:
+            return converter(value)
     return "UNKNOWN"
 
 
@@ -39,11 +44,34 @@ class RDSSecretsManagerConnection(Connection):
     Connection for RDS with secretsmanager.
     """
 
-    def __init__(self, cluster_arn, secret_arn, database, client):
+    def __init__(self, cluster_arn, secret_arn, database, client_factory: Callable[[], Any]):
         self.cluster_arn = cluster_arn
         self.secret_arn = secret_arn
         self.database = database
-        self.client = client
+        self._client_factory = client_factory
+        self._client = None
+        # The settings never change after construction, so .show can reuse this.
+        self._description = "\n".join(
+            [
+                "type: rds-secretsmanager",
+                f"cluster_arn: {cluster_arn}",
+                f"secret_arn: {secret_arn}",
+                f"database: {database}",
+            ]
+        )
+
+    @property
+    def client(self):
+        """
+        The rds-data client. It is only created when first needed, so that loading a config
+        doesn't pay for boto3.
+        """
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def __str__(self):
+        return self._description
 
     def execute(self, sql: str) -> StatementResult:
         logging.debug("Executing query: %s", sql)
@@ -3,10 +3,17 @@ Statement result types.
 """
 import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List
 from tabulate import tabulate
 
 
+@lru_cache(maxsize=None)
+def _is_interactive() -> bool:
+    # stdin does not stop being a terminal mid-session, so ask once.
+    return sys.stdin.isatty()
+
+
 class StatementResult(ABC):
     """
     A statement result.
@@ -53,9 +60,7 @@ class QueryResult(StatementResult):
         self.rows = rows
 
     def __str__(self):
-        tablefmt = "psql"
-        headers = self.headers
-        if not sys.stdin.isatty():
-            tablefmt = "tsv"
-            headers = []
-        return tabulate(self.rows, headers=headers, tablefmt=tablefmt)
+        if not _is_interactive():
+            # Piped output is meant for other programs: plain TSV, no padding, no tabulate pass.
+            return "\n".join(["\t".join(row) for row in self.rows])
+        return tabulate(self.rows, headers=self.headers, tablefmt="psql")
@@ -3,41 +3,66 @@ Settings module for the cli.
 """
 import os
 import logging
-import yaml
-import boto3
+from functools import partial
+from typing import Any, Dict, Tuple
 from rdsline.connections import NoopConnection
 from rdsline.connections.rds_secretsmanager import RDSSecretsManagerConnection
 
 DEFAULT_CONFIG_FILE = os.path.expanduser("~/.rdsline")
 
+# Parsed config files keyed by absolute path, stored with the (mtime_ns, size) they were read at.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 
 def _default_client_provider(profile: str, region: str):
     logging.debug("Setting aws credentials profile to %s - region: %s", profile, region)
+    import boto3  # pylint: disable=import-outside-toplevel
+
     session = boto3.Session(profile_name=profile)
     return session.client("rds-data", region_name=region)
 
 
 def _get_region(cluster_arn: str):
-    arn_parts = cluster_arn.split(":")
+    # arn:partition:service:region:... - no need to split past the region.
+    arn_parts = cluster_arn.split(":", 4)
     return arn_parts[3]
 
 
+def _load_yaml(file: str):
+    # Binary mode: the YAML reader detects and decodes UTF-8 itself.
+    with open(file, "rb") as stream:
+        stat = os.fstat(stream.fileno())
+        key = os.path.abspath(file)
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            logging.debug("Using cached configuration for: %s", file)
+            return cached[1]
+        # Imported here so that starting without a config file never loads yaml.
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        # CSafeLoader is only there when PyYAML is built against libyaml.
+        settings = yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    _YAML_CACHE[key] = (version, settings)
+    return settings
+
+
 def from_file(file: str, client_provider=_default_client_provider):
     """
     Reads settings from a file.
     """
     logging.debug("Reading configuration file from: %s", file)
-    settings = {}
-    with open(file, "r", encoding="utf-8") as stream:
-        settings = yaml.safe_load(stream)
+    settings = _load_yaml(file)
     logging.debug("Settings: %s", settings)
     if settings["type"] != "rds-secretsmanager":
         raise Exception(f"Unsupported database connection type: {settings['type']}")
     region = _get_region(settings["cluster_arn"])
     profile = settings["credentials"]["profile"]
-    client = client_provider(profile, region)
     return RDSSecretsManagerConnection(
-        settings["cluster_arn"], settings["secret_arn"], settings["database"], client
+        settings["cluster_arn"],
+        settings["secret_arn"],
+        settings["database"],
+        partial(client_provider, profile, region),
     )
 
 
@@ -49,7 +74,8 @@ def from_args(
     """
     if args.config is not None:
         return from_file(args.config, client_provider)
-    if os.path.exists(default_config_file):
+    try:
         return from_file(default_config_file, client_provider)
-    logging.debug("No config. Set to null connector")
-    return NoopConnection()
+    except FileNotFoundError:
+        logging.debug("No config. Set to null connector")
+        return NoopConnection()
@@ -0,0 +1,110 @@
+import io
+import shutil
+import sys
+from functools import partial
+import pytest
+from rdsline import cli, settings
+from rdsline.commands import ConfigCommand
+from rdsline.connections import NoopConnection
+
+
+def test_parse_args_defaults():
+    args = cli._parse_args([])
+    assert args.config is None
+    assert args.debug == False
+
+
+def test_parse_args_config_and_debug():
+    args = cli._parse_args(["--config", "config.yaml", "--debug"])
+    assert args.config == "config.yaml"
+    assert args.debug == True
+
+
+def test_parse_args_config_with_equals():
+    args = cli._parse_args(["--config=config.yaml"])
+    assert args.config == "config.yaml"
+
+
+def test_parse_args_accepts_option_prefixes():
+    args = cli._parse_args(["--conf", "config.yaml", "--deb"])
+    assert args.config == "config.yaml"
+    assert args.debug == True
+    assert cli._parse_args(["--conf=config.yaml"]).config == "config.yaml"
+
+
+@pytest.mark.parametrize("argv,expected_error", [
+    (["--config"], "--config"),
+    (["--config", "--debug"], "--config"),
+    (["--debug=yes"], "--debug"),
+    (["--bogus"], "--bogus"),
+])
+def test_parse_args_fails_for_bad_arguments(argv, expected_error, capsys):
+    with pytest.raises(SystemExit) as e:
+        cli._parse_args(argv)
+    assert e.value.code == 2
+    assert expected_error in capsys.readouterr().err
+
+
+def test_parse_args_help(capsys):
+    with pytest.raises(SystemExit) as e:
+        cli._parse_args(["--help"])
+    assert e.value.code == 0
+    out = capsys.readouterr().out
+    for option in cli._LONG_OPTIONS:
+        assert option in out
+
+
+def test_parse_args_version(capsys):
+    with pytest.raises(SystemExit) as e:
+        cli._parse_args(["--version"])
+    assert e.value.code == 0
+    assert capsys.readouterr().out.strip() == "rdsline " + cli.VERSION
+
+
+def test_config_command_expects_a_file():
+    config = ConfigCommand(None)
+    assert config([".config"]) == "ERROR: Expecting config file"
+    assert config([".config", "   "]) == "ERROR: Expecting config file"
+    assert config.connection is None
+
+
+def _run_main(monkeypatch, tmp_path, stdin):
+    monkeypatch.setattr(sys, "argv", ["rdsline"])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    # No config anywhere, so main() starts with the no-op connection.
+    monkeypatch.setattr(
+        settings, "from_args", partial(settings.from_args, default_config_file=str(tmp_path / "missing"))
+    )
+    with pytest.raises(SystemExit) as e:
+        cli.main()
+    return e.value.code
+
+
+@pytest.mark.parametrize("stdin", [".show\n.quit\n", ".show\n.quit", ".show\n"])
+def test_main_reads_piped_input_until_quit_or_eof(stdin, monkeypatch, tmp_path, capsys):
+    assert _run_main(monkeypatch, tmp_path, stdin) == 0
+    assert capsys.readouterr().out == "No connection set\n"
+
+
+def test_main_joins_multiline_statements(monkeypatch, tmp_path):
+    executed = []
+    monkeypatch.setattr(NoopConnection, "execute", lambda _, sql: executed.append(sql))
+    assert _run_main(monkeypatch, tmp_path, "select *\nfrom t\nwhere x = 1;\n") == 0
+    assert executed == ["select * from t where x = 1;"]
+
+
+def test_main_passes_config_path_with_spaces(monkeypatch, tmp_path, capsys):
+    config_dir = tmp_path / "my configs"
+    config_dir.mkdir()
+    shutil.copy("config.yaml", config_dir / "config.yaml")
+    stdin = f".config {config_dir / 'config.yaml'}\n"
+    assert _run_main(monkeypatch, tmp_path, stdin) == 0
+    assert "database: DATABASE_NAME" in capsys.readouterr().out
+
+
+def test_main_ignores_blank_lines(monkeypatch, tmp_path, capsys):
+    executed = []
+    monkeypatch.setattr(NoopConnection, "execute", lambda _, sql: executed.append(sql))
+    assert _run_main(monkeypatch, tmp_path, "\n  \n\n") == 0
+    assert executed == []
+    assert capsys.readouterr().out == ""
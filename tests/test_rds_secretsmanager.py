@@ -8,15 +8,13 @@ DATABASE = "the_database"
 SECRET_ARN = "the_secret_arn"
 
 class DummyClient:
+    __slots__ = ("sql", "response")
     def __init__(self, expected_sql, expected_response):
         self.sql = expected_sql
         self.response = expected_response
     def execute_statement(self, resourceArn, database, secretArn, includeResultMetadata, sql):
-        assert resourceArn == CLUSTER_ARN
-        assert secretArn == SECRET_ARN
-        assert database == DATABASE
-        assert includeResultMetadata == True
-        assert sql == self.sql
+        assert (resourceArn, secretArn, database, includeResultMetadata, sql) == \
+            (CLUSTER_ARN, SECRET_ARN, DATABASE, True, self.sql)
         return self.response
 
 
@@ -26,9 +24,9 @@ def test_can_get_dml_results():
     }
     sql = "UPDATE t SET i = 1"
     client = DummyClient(sql, expected_response)
-    conn = RDSSecretsManagerConnection(CLUSTER_ARN, SECRET_ARN, DATABASE, client)
+    conn = RDSSecretsManagerConnection(CLUSTER_ARN, SECRET_ARN, DATABASE, lambda: client)
     results = conn.execute(sql) 
-    assert type(results) == DMLResult
+    assert isinstance(results, DMLResult)
     assert results.number_updated == 3
 
 
@@ -66,10 +64,19 @@ def test_can_get_query_results():
     }
     sql = "SELECT * FROM t1"
     client = DummyClient(sql, expected_response)
-    conn = RDSSecretsManagerConnection(CLUSTER_ARN, SECRET_ARN, DATABASE, client)
+    conn = RDSSecretsManagerConnection(CLUSTER_ARN, SECRET_ARN, DATABASE, lambda: client)
     results = conn.execute(sql) 
 
-    assert type(results) == QueryResult
+    assert isinstance(results, QueryResult)
     assert results.headers == ["stringCol", "boolCol", "doubleCol", "longCol", "blobCol", "withNulls", "unknownCol"]
     assert results.rows[0] == ["stringRow1", "True", "2.0", "12", "BLOB(6161)", "NULL", "UNKNOWN"]
-    assert results.rows[1] == ["stringRow2", "False", "1.0", "42", "BLOB(68656c6c)","69", "UNKNOWN"]
\ No newline at end of file
+    assert results.rows[1] == ["stringRow2", "False", "1.0", "42", "BLOB(68656c6c)","69", "UNKNOWN"]
+
+def test_shows_connection_settings():
+    conn = RDSSecretsManagerConnection(CLUSTER_ARN, SECRET_ARN, DATABASE, lambda: None)
+    assert str(conn) == "\n".join([
+        "type: rds-secretsmanager",
+        "cluster_arn: the_resource_arn",
+        "secret_arn: the_secret_arn",
+        "database: the_database",
+    ])
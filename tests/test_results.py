@@ -0,0 +1,20 @@
+from rdsline import results
+from rdsline.results import QueryResult
+
+
+def test_query_result_is_tsv_when_not_interactive(monkeypatch):
+    monkeypatch.setattr(results, "_is_interactive", lambda: False)
+    result = QueryResult(["name", "amount"], [["a", "1.50"], ["ccc", "2"]])
+    assert str(result) == "a\t1.50\nccc\t2"
+
+
+def test_query_result_is_a_table_when_interactive(monkeypatch):
+    monkeypatch.setattr(results, "_is_interactive", lambda: True)
+    result = QueryResult(["name"], [["a"]])
+    assert str(result).splitlines() == [
+        "+--------+",
+        "| name   |",
+        "|--------|",
+        "| a      |",
+        "+--------+",
+    ]
@@ -1,64 +1,84 @@
 import os
-from collections import namedtuple
+from dataclasses import dataclass
+from typing import Optional
+import pytest
 from rdsline import settings
 from rdsline.connections import NoopConnection
 
+CLUSTER_ARN = 'arn:aws:rds:us-east-1:<ACCOUNT_ID>:cluster:<CLUSTER_NAME>'
+SECRET_ARN = 'arn:aws:secretsmanager:us-east-1:<ACCOUNT_ID>:secret:<SECRET_ID>'
+DATABASE = 'DATABASE_NAME'
+
+
 class DummyClient:
-    pass
+    __slots__ = ()
 
 
 DUMMY_CLIENT = DummyClient()
+EXPECTED_SETTINGS = (CLUSTER_ARN, SECRET_ARN, DATABASE, DUMMY_CLIENT)
 def dummy_client_provider(profile, region):
     assert profile == 'default'
     assert region == 'us-east-1'
     return DUMMY_CLIENT
 
 
-def test_read_settings_from_file():
-    connection = settings.from_file('config.yaml', client_provider=dummy_client_provider)
-    assert connection.cluster_arn == 'arn:aws:rds:us-east-1:<ACCOUNT_ID>:cluster:<CLUSTER_NAME>'
-    assert connection.secret_arn == 'arn:aws:secretsmanager:us-east-1:<ACCOUNT_ID>:secret:<SECRET_ID>'
-    assert connection.database == 'DATABASE_NAME'
-    assert connection.client == DUMMY_CLIENT
+def _connection_settings(connection):
+    return (connection.cluster_arn, connection.secret_arn, connection.database, connection.client)
+
+
+@dataclass(frozen=True)
+class Args:
+    config: Optional[str]
+
+
+@pytest.mark.parametrize("load", [
+    lambda: settings.from_file('config.yaml', client_provider=dummy_client_provider),
+    lambda: settings.from_args(Args("config.yaml"), dummy_client_provider),
+    lambda: settings.from_args(Args(None), dummy_client_provider, default_config_file="config.yaml"),
+], ids=["from_file", "from_args", "from_default_file"])
+def test_reads_settings(load):
+    assert _connection_settings(load()) == EXPECTED_SETTINGS
+
+
+def test_default_config_file():
+    assert settings.DEFAULT_CONFIG_FILE == os.path.expanduser("~/.rdsline")
 
 
 def test_fails_for_unknown_type():
-    try:
+    with pytest.raises(Exception, match="fake-unknown-type"):
         settings.from_file('tests/configs/unknown_type.yaml')
-        assert False
-    except Exception as e:
-        assert "fake-unknown-type" in str(e)
 
 
 def test_fails_for_missing_setting():
-    try:
+    with pytest.raises(KeyError):
         settings.from_file('tests/configs/missing_cluster_arn.yaml')
-        assert False
-    except KeyError as e:
-        pass
-
-
-Args = namedtuple("Args", "config")
-def test_can_get_settings_from_args():
-    args = Args("config.yaml")
-    connection = settings.from_args(args, dummy_client_provider)
-    assert connection.cluster_arn == 'arn:aws:rds:us-east-1:<ACCOUNT_ID>:cluster:<CLUSTER_NAME>'
-    assert connection.secret_arn == 'arn:aws:secretsmanager:us-east-1:<ACCOUNT_ID>:secret:<SECRET_ID>'
-    assert connection.database == 'DATABASE_NAME'
-    assert connection.client == DUMMY_CLIENT
-
-
-def test_gets_from_default_file():
-    assert settings.DEFAULT_CONFIG_FILE == os.path.expanduser("~/.rdsline")
-    args = Args(None)
-    connection = settings.from_args(args, dummy_client_provider, default_config_file="config.yaml")
-    assert connection.cluster_arn == 'arn:aws:rds:us-east-1:<ACCOUNT_ID>:cluster:<CLUSTER_NAME>'
-    assert connection.secret_arn == 'arn:aws:secretsmanager:us-east-1:<ACCOUNT_ID>:secret:<SECRET_ID>'
-    assert connection.database == 'DATABASE_NAME'
-    assert connection.client == DUMMY_CLIENT
 
 
 def test_gets_noop_if_else_fails():
     args = Args(None)
     connection = settings.from_args(args, dummy_client_provider, default_config_file="unexistant_file.yaml")
-    assert type(connection) == NoopConnection
\ No newline at end of file
+    assert isinstance(connection, NoopConnection)
+
+
+def test_reuses_parsed_file_until_it_changes(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    with open('config.yaml', encoding='utf-8') as stream:
+        config_file.write_text(stream.read(), encoding='utf-8')
+    first = settings._load_yaml(str(config_file))
+    assert settings._load_yaml(str(config_file)) is first
+
+    config_file.write_text(config_file.read_text(encoding='utf-8').replace('DATABASE_NAME', 'OTHER_DATABASE'), encoding='utf-8')
+    connection = settings.from_file(str(config_file), client_provider=dummy_client_provider)
+    assert connection.database == 'OTHER_DATABASE'
+
+
+def test_client_is_created_on_first_use():
+    calls = []
+    def counting_client_provider(profile, region):
+        calls.append((profile, region))
+        return DUMMY_CLIENT
+    connection = settings.from_file('config.yaml', client_provider=counting_client_provider)
+    assert calls == []
+    assert connection.client == DUMMY_CLIENT
+    assert connection.client == DUMMY_CLIENT
+    assert calls == [('default', 'us-east-1')]